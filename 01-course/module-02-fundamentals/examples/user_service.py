@@ -6,40 +6,224 @@ DO NOT use in production!
 
 import sqlite3
 import hashlib
+import time
+from collections import OrderedDict
 from datetime import datetime
 
+# Column positions the cache relies on: id first, then the INSERT order
+# (username, password). Column 3 is what login reports as the role.
+ID_COL, USERNAME_COL, PASSWORD_COL, ROLE_COL = 0, 1, 2, 3
+
+
+def _cache_key_for_id(user_id):
+    """Return user_id as the int the cache is keyed on, or None if it is not a plain id."""
+    if isinstance(user_id, int):
+        return user_id
+    if isinstance(user_id, str) and user_id.strip().isascii() and user_id.strip().isdigit():
+        return int(user_id)
+    return None
+
+
+def _is_plain_value(value):
+    """True if value cannot break out of its quoted slot in the f-string SQL."""
+    return isinstance(value, (int, float)) or (isinstance(value, str) and "'" not in value)
+
+
+class UserCache:
+    """
+    Bounded LRU + TTL cache of user rows, keyed by id.
+
+    Username and email indices are built from the values callers looked rows up
+    by, so the cache never has to guess which column holds the email.
+    """
+
+    def __init__(self, max_size=1024, ttl_seconds=300.0, clock=time.monotonic):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self._rows = OrderedDict()  # id -> [row, expires_at, username, email]
+        self._by_username = {}
+        self._by_email = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def peek_by_id(self, user_id):
+        """Return a live cached row without touching the hit/miss counters."""
+        entry = self._rows.get(user_id)
+        if entry is None:
+            return None
+        if self.clock() >= entry[1]:
+            self._drop(user_id)
+            return None
+        self._rows.move_to_end(user_id)
+        return entry[0]
+
+    def peek_by_username(self, username):
+        user_id = self._by_username.get(username)
+        return None if user_id is None else self.peek_by_id(user_id)
+
+    def peek_by_email(self, email):
+        user_id = self._by_email.get(email)
+        return None if user_id is None else self.peek_by_id(user_id)
+
+    def get_by_id(self, user_id):
+        return self._count(self.peek_by_id(user_id))
+
+    def get_by_username(self, username):
+        return self._count(self.peek_by_username(username))
+
+    def get_by_email(self, email):
+        return self._count(self.peek_by_email(email))
+
+    def record_hit(self):
+        self.hits += 1
+
+    def record_miss(self):
+        self.misses += 1
+
+    def _count(self, row):
+        if row is None:
+            self.record_miss()
+        else:
+            self.record_hit()
+        return row
+
+    def put(self, row, username=None, email=None):
+        user_id = row[ID_COL]
+        entry = self._rows.pop(user_id, None)
+        if entry is not None:
+            # Keep secondary keys learned from earlier lookups of the same row
+            username = username if username is not None else entry[2]
+            email = email if email is not None else entry[3]
+        self._rows[user_id] = [row, self.clock() + self.ttl_seconds, username, email]
+        if username is not None:
+            self._by_username[username] = user_id
+        if email is not None:
+            self._by_email[email] = user_id
+        while len(self._rows) > self.max_size:
+            oldest_id = next(iter(self._rows))
+            self._drop(oldest_id)
+            self.evictions += 1
+
+    def invalidate_id(self, user_id):
+        if user_id in self._rows:
+            self._drop(user_id)
+            self.invalidations += 1
+
+    def invalidate_username(self, username):
+        user_id = self._by_username.get(username)
+        if user_id is not None:
+            self.invalidate_id(user_id)
+
+    def invalidate_email(self, email):
+        user_id = self._by_email.get(email)
+        if user_id is not None:
+            self.invalidate_id(user_id)
+
+    def clear(self):
+        self.invalidations += len(self._rows)
+        self._rows.clear()
+        self._by_username.clear()
+        self._by_email.clear()
+
+    def _drop(self, user_id):
+        _, _, username, email = self._rows.pop(user_id)
+        if username is not None and self._by_username.get(username) == user_id:
+            del self._by_username[username]
+        if email is not None and self._by_email.get(email) == user_id:
+            del self._by_email[email]
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._rows),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
 class UserService:
-    def __init__(self):
-        self.conn = sqlite3.connect('users.db')
+    def __init__(self, db_path='users.db', cache_size=1024, cache_ttl=300.0):
+        # cache_size=None disables caching entirely (every call goes to SQLite)
+        self.conn = sqlite3.connect(db_path)
         self.admin_password = "admin123"
+        self.cache = None if cache_size is None else UserCache(max_size=cache_size, ttl_seconds=cache_ttl)
         
     def register_user(self, username, password, email):
         query = f"INSERT INTO users (username, password, email) VALUES ('{username}', '{password}', '{email}')"
         self.conn.execute(query)
         self.conn.commit()
+        if self.cache is not None:
+            if all(_is_plain_value(value) for value in (username, password, email)):
+                # A new row may reuse a username/email that a cached row still claims
+                self.cache.invalidate_username(username)
+                self.cache.invalidate_email(email)
+            else:
+                self.cache.clear()
         return {"status": "success", "user": username}
     
     def login(self, username, password):
+        if self.cache is not None:
+            cached = self.cache.peek_by_username(username)
+            if cached is not None and cached[PASSWORD_COL] == password:
+                self.cache.record_hit()
+                return {"authenticated": True, "user": cached[ID_COL], "role": cached[ROLE_COL]}
+            self.cache.record_miss()
+
         query = f"SELECT * FROM users WHERE username = '{username}' AND password = '{password}'"
         result = self.conn.execute(query).fetchone()
         
         if result:
-            return {"authenticated": True, "user": result[0], "role": result[3]}
+            if self.cache is not None:
+                self.cache.put(result, username=username if _is_plain_value(username) else None)
+            return {"authenticated": True, "user": result[ID_COL], "role": result[ROLE_COL]}
         return {"authenticated": False}
     
     def get_user_by_id(self, user_id):
+        # Only plain ids (int or digit strings like "5") are looked up in the cache
+        cache_key = _cache_key_for_id(user_id)
+        if self.cache is not None and cache_key is not None:
+            cached = self.cache.get_by_id(cache_key)
+            if cached is not None:
+                return cached
+
         query = f"SELECT * FROM users WHERE id = {user_id}"
         user = self.conn.execute(query).fetchone()
+        if user and self.cache is not None:
+            self.cache.put(user)
         return user
     
     def update_user_email(self, user_id, new_email):
         query = f"UPDATE users SET email = '{new_email}' WHERE id = {user_id}"
         self.conn.execute(query)
         self.conn.commit()
+        self._invalidate_written_id(user_id, new_email)
     
     def delete_user(self, user_id):
         self.conn.execute(f"DELETE FROM users WHERE id = {user_id}")
         self.conn.commit()
+        self._invalidate_written_id(user_id)
+
+    def _invalidate_written_id(self, user_id, *values):
+        # Every value is interpolated into the query, so anything other than a
+        # plain id/value may have touched arbitrary rows - drop everything then
+        if self.cache is None:
+            return
+        cache_key = _cache_key_for_id(user_id)
+        if cache_key is not None and all(_is_plain_value(value) for value in values):
+            self.cache.invalidate_id(cache_key)
+            for value in values:
+                self.cache.invalidate_email(value)
+        else:
+            self.cache.clear()
+
+    def cache_stats(self):
+        return self.cache.stats() if self.cache is not None else None
     
     def get_all_users(self):
         return self.conn.execute("SELECT * FROM users").fetchall()
@@ -59,8 +243,12 @@ class UserService:
                 f.write(f"{user[0]},{user[1]},{user[2]},{user[3]}\n")
     
     def send_password_reset_email(self, email):
-        user_query = f"SELECT * FROM users WHERE email = '{email}'"
-        user = self.conn.execute(user_query).fetchone()
+        user = self.cache.get_by_email(email) if self.cache is not None else None
+        if user is None:
+            user_query = f"SELECT * FROM users WHERE email = '{email}'"
+            user = self.conn.execute(user_query).fetchone()
+            if user and self.cache is not None:
+                self.cache.put(user, email=email if _is_plain_value(email) else None)
         
         if user:
             reset_token = user[0] + "_" + str(datetime.now().timestamp())
@@ -68,3 +256,123 @@ class UserService:
     
     def close(self):
         self.conn.close()
+
+
+def _make_benchmark_service(num_users, cache_size):
+    service = UserService(db_path=':memory:', cache_size=cache_size)
+    service.conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, username TEXT, password TEXT, email TEXT)"
+    )
+    for i in range(1, num_users + 1):
+        service.register_user(f"user{i}", f"pw{i}", f"user{i}@example.com")
+    return service
+
+
+def verify_cache_consistency(num_users=50, num_ops=5000, write_ratio=0.2, seed=7):
+    """
+    Run a mixed workload (including injected writes) and check the cache against SQLite.
+
+    After every write, get_user_by_id and login for the affected users must match
+    a direct parameterised query, and cache misses must equal the SELECTs the
+    service actually issued. Raises RuntimeError on the first mismatch.
+    """
+    import random
+
+    service = _make_benchmark_service(num_users, cache_size=16)
+    selects = {"count": 0, "enabled": True}
+
+    def count_selects(statement):
+        if selects["enabled"] and statement.lstrip().upper().startswith("SELECT"):
+            selects["count"] += 1
+
+    service.conn.set_trace_callback(count_selects)
+
+    def direct(query, params):
+        selects["enabled"] = False
+        try:
+            return service.conn.execute(query, params).fetchone()
+        finally:
+            selects["enabled"] = True
+
+    def check(user_id, op):
+        expected_row = direct("SELECT * FROM users WHERE id = ?", (user_id,))
+        if service.get_user_by_id(user_id) != expected_row:
+            raise RuntimeError(f"op {op}: get_user_by_id({user_id}) is stale")
+        login_row = direct(
+            "SELECT * FROM users WHERE username = ? AND password = ?", (f"user{user_id}", f"pw{user_id}")
+        )
+        expected_login = (
+            {"authenticated": True, "user": login_row[ID_COL], "role": login_row[ROLE_COL]}
+            if login_row else {"authenticated": False}
+        )
+        if service.login(f"user{user_id}", f"pw{user_id}") != expected_login:
+            raise RuntimeError(f"op {op}: login for user{user_id} is stale")
+
+    rng = random.Random(seed)
+    for op in range(num_ops):
+        user_id, other_id = rng.randint(1, num_users), rng.randint(1, num_users)
+        roll = rng.random()
+        if roll < write_ratio:
+            kind = rng.random()
+            if kind < 0.5:
+                service.update_user_email(user_id, f"user{user_id}+{op}@example.com")
+            elif kind < 0.8:
+                # Injected email that renames another user
+                service.update_user_email(user_id, f"z', username='renamed{op}' WHERE id={other_id} --")
+            elif kind < 0.9:
+                service.register_user(f"user{other_id}', 'pw{op}', 'dup{op}@example.com') --", "x", "x")
+            else:
+                service.delete_user(user_id)
+            check(user_id, op)
+            check(other_id, op)
+        elif roll < 0.6:
+            service.get_user_by_id(user_id)
+        else:
+            # Some logins use a wrong password, which must count as a miss
+            password = f"pw{user_id}" if rng.random() < 0.8 else "wrong"
+            service.login(f"user{user_id}", password)
+
+    stats = service.cache_stats()
+    if stats["misses"] != selects["count"]:
+        raise RuntimeError(f"{stats['misses']} cache misses recorded but {selects['count']} SELECTs issued")
+    service.close()
+    return stats
+
+
+def benchmark_read_heavy_workload(num_users=500, num_ops=20000, write_ratio=0.05, seed=42):
+    """
+    Time a mixed read/write workload against an in-memory DB, with and without the cache.
+
+    The "uncached" run uses cache_size=None, so it measures plain SQLite calls
+    with no cache bookkeeping at all. See verify_cache_consistency for the
+    matching correctness check.
+    """
+    import random
+
+    results = {}
+    for label, cache_size in (("uncached", None), ("cached", 1024)):
+        service = _make_benchmark_service(num_users, cache_size)
+        rng = random.Random(seed)
+        start = time.perf_counter()
+        for op in range(num_ops):
+            user_id = rng.randint(1, num_users)
+            roll = rng.random()
+            if roll < write_ratio:
+                service.update_user_email(user_id, f"user{user_id}+{op}@example.com")
+            elif roll < 0.5:
+                service.get_user_by_id(user_id)
+            else:
+                service.login(f"user{user_id}", f"pw{user_id}")
+        elapsed = time.perf_counter() - start
+
+        results[label] = {"seconds": elapsed, "ops_per_sec": num_ops / elapsed, **(service.cache_stats() or {})}
+        service.close()
+    return results
+
+
+if __name__ == "__main__":
+    verify_cache_consistency()
+    print("cache consistency check passed")
+    for label, stats in benchmark_read_heavy_workload().items():
+        hit_rate = f", hit rate {stats['hit_rate']:.1%}" if "hit_rate" in stats else ""
+        print(f"{label:>8}: {stats['ops_per_sec']:,.0f} ops/s{hit_rate}")
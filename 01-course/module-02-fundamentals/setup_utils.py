@@ -9,9 +9,14 @@ surface area focused on the tactics taught in this module.
 from __future__ import annotations
 
 import base64
+import difflib
+import hashlib
+import inspect
+import json
 import os
+import tempfile
 from pathlib import Path
-from typing import Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple
+from typing import Dict, Iterable, List, Mapping, MutableMapping, Optional, Sequence, Tuple, TypedDict
 
 import anthropic
 import openai
@@ -326,176 +331,340 @@ def save_markdown(path: str | Path, content: str) -> None:
     file_path.write_text(content)
 
 
+# ============================================
+# 🗄️ EVALUATION STORE (Incremental Re-evaluation)
+# ============================================
+
+EVALUATION_STORE_PATH: Path = Path(
+    os.getenv("MODULE2_EVAL_STORE", str(Path(__file__).with_name(".evaluation_store.json")))
+)
+
+
+def _hash_value(value: object) -> str:
+    """Stable SHA-256 of a JSON-serialisable value (messages, tactic lists, ...)."""
+    payload = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+# Attempts kept per activity; signals and judgments not referenced by them are pruned
+MAX_STORED_ATTEMPTS: int = 5
+
+
+class _StoredAttempt(TypedDict):
+    messages: List[Dict[str, object]]
+    message_hashes: List[str]
+    judgment_key: Optional[str]
+
+
+class _EvaluationStore:
+    """
+    Persistent JSON store behind `evaluate_prompt`.
+
+    - `signals`: per-message metric signals keyed by message hash
+    - `judgments`: LLM-as-Judge output keyed by (message hashes, tactics, provider, model)
+    - `attempts`: the last `MAX_STORED_ATTEMPTS` submissions per activity, each with
+      its messages, message hashes and judgment key (used for diffs and pruning)
+
+    The file also records a `fingerprint` of the evaluation code; data written by
+    a different version of the keyword tables or judge prompt is discarded on load.
+    """
+
+    def __init__(self, path: Path, fingerprint: str) -> None:
+        self.path = path
+        self.fingerprint = fingerprint
+        self.signals: Dict[str, Dict[str, object]] = {}
+        self.judgments: Dict[str, str] = {}
+        self.attempts: Dict[str, List[_StoredAttempt]] = {}
+        self.load()
+
+    def load(self) -> None:
+        try:
+            loaded = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return  # Missing or unreadable store: start fresh
+        if not isinstance(loaded, dict) or loaded.get("fingerprint") != self.fingerprint:
+            return  # Written by a different version of the evaluation code
+        self.signals = loaded.get("signals") or {}
+        self.judgments = loaded.get("judgments") or {}
+        self.attempts = loaded.get("attempts") or {}
+
+    def record_attempt(
+        self,
+        activity_name: str,
+        messages: Sequence[Mapping[str, object]],
+        message_hashes: Sequence[str],
+        judgment_key: Optional[str],
+    ) -> None:
+        attempts = self.attempts.get(activity_name, [])
+        attempts.append({
+            "messages": [dict(msg) for msg in messages],
+            "message_hashes": list(message_hashes),
+            "judgment_key": judgment_key,
+        })
+        self.attempts[activity_name] = attempts[-MAX_STORED_ATTEMPTS:]
+
+    def last_attempt(self, activity_name: str) -> Optional[List[Dict[str, object]]]:
+        attempts = self.attempts.get(activity_name)
+        return attempts[-1]["messages"] if attempts else None
+
+    def prune(self) -> None:
+        """Drop signals and judgments that no stored attempt refers to."""
+        live_messages = set()
+        live_judgments = set()
+        for attempts in self.attempts.values():
+            for attempt in attempts:
+                live_messages.update(attempt["message_hashes"])
+                live_judgments.add(attempt["judgment_key"])
+        self.signals = {key: value for key, value in self.signals.items() if key in live_messages}
+        self.judgments = {key: value for key, value in self.judgments.items() if key in live_judgments}
+
+    def save(self) -> None:
+        self.prune()
+        payload = json.dumps(
+            {
+                "fingerprint": self.fingerprint,
+                "signals": self.signals,
+                "judgments": self.judgments,
+                "attempts": self.attempts,
+            },
+            ensure_ascii=False,
+            default=str,
+        )
+        tmp_path = None
+        try:
+            # Write to a temp file and swap it in so a crash never leaves a half-written store
+            with tempfile.NamedTemporaryFile(
+                "w", encoding="utf-8", dir=self.path.parent, prefix=self.path.name, suffix=".tmp", delete=False
+            ) as tmp_file:
+                tmp_path = tmp_file.name
+                tmp_file.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            print(f"⚠️ Could not save evaluation store to {self.path}: {exc}")
+
+    def clear(self) -> None:
+        self.signals, self.judgments, self.attempts = {}, {}, {}
+        self.save()
+
+
+def _evaluation_fingerprint() -> str:
+    """
+    Hash of everything that determines stored metrics and judgments: the keyword
+    tables, the metric code, the metrics summary, and the judge prompt.
+    """
+    parts: List[object] = [
+        _XML_TAGS, _COT_KEYWORDS, _ROLE_INDICATORS, _TOT_KEYWORDS, _TOT_TAGS, _JUDGE_KEYWORDS,
+        _TACTIC_DESCRIPTIONS, _JUDGE_PROMPT_TEMPLATE,
+    ]
+    for func in (_calculate_message_signals, _calculate_traditional_metrics, _format_metrics_summary):
+        try:
+            parts.append(inspect.getsource(func))
+        except (OSError, TypeError):  # pragma: no cover - source unavailable (e.g. frozen build)
+            parts.append(func.__qualname__)
+    return _hash_value(parts)
+
+
+_evaluation_store: Optional[_EvaluationStore] = None
+
+
+def _get_evaluation_store() -> _EvaluationStore:
+    global _evaluation_store
+    if _evaluation_store is None or _evaluation_store.path != EVALUATION_STORE_PATH:
+        _evaluation_store = _EvaluationStore(EVALUATION_STORE_PATH, _evaluation_fingerprint())
+    return _evaluation_store
+
+
+def clear_evaluation_store() -> None:
+    """Forget all memoized metrics, stored judgments, and previous attempts."""
+    _get_evaluation_store().clear()
+    print(f"🧹 Evaluation store cleared ({EVALUATION_STORE_PATH})")
+
+
+def _format_attempt_diff(
+    previous: Sequence[Mapping[str, object]],
+    current: Sequence[Mapping[str, object]],
+) -> str:
+    """
+    Summarise what changed since the previous attempt.
+
+    Messages are aligned by hash, so inserting or removing a message only reports
+    that message; edited messages get a unified diff of their content.
+    """
+    lines = ["🔍 CHANGES SINCE LAST ATTEMPT", "=" * 70]
+    matcher = difflib.SequenceMatcher(
+        a=[_hash_value(msg) for msg in previous],
+        b=[_hash_value(msg) for msg in current],
+        autojunk=False,
+    )
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag == "equal":
+            continue
+        if tag == "delete":
+            for i in range(i1, i2):
+                lines.append(f"➖ Message {i + 1} removed ({previous[i].get('role')})")
+        elif tag == "insert":
+            for j in range(j1, j2):
+                lines.append(f"➕ Message {j + 1} added ({current[j].get('role')})")
+        else:  # replace: pair edited messages up, report any surplus as added/removed
+            for i, j in zip(range(i1, i2), range(j1, j2)):
+                before, after = previous[i], current[j]
+                lines.append(f"✏️ Message {j + 1} changed ({before.get('role')} → {after.get('role')})")
+                diff = difflib.unified_diff(
+                    str(before.get("content", "")).splitlines(),
+                    str(after.get("content", "")).splitlines(),
+                    fromfile="previous",
+                    tofile="current",
+                    lineterm="",
+                )
+                lines.extend(f"    {line}" for line in diff)
+            paired = min(i2 - i1, j2 - j1)
+            for i in range(i1 + paired, i2):
+                lines.append(f"➖ Message {i + 1} removed ({previous[i].get('role')})")
+            for j in range(j1 + paired, j2):
+                lines.append(f"➕ Message {j + 1} added ({current[j].get('role')})")
+    if len(lines) == 2:
+        lines.append("No changes - this submission is identical to your last attempt.")
+    lines.append("=" * 70)
+    return "\n".join(lines)
+
+
 # ============================================
 # 📊 PROMPT EVALUATION (Traditional Metrics + LLM-as-Judge)
 # ============================================
 
+# Keyword tables used by the traditional metrics. Every keyword is matched
+# against the lowercased repr of a single message; none of them can span the
+# "}, {" boundary between messages, so per-message matches aggregate exactly.
+_XML_TAGS = ["code", "requirements", "context", "example", "document", "thinking", "output",
+             "test_file", "source_code", "analysis", "quotes", "evaluation"]
+_COT_KEYWORDS = ["step-by-step", "think through", "reasoning", "analyze", "before", "first", "then"]
+_ROLE_INDICATORS = ["you are a", "you are an", "act as", "role:", "persona:"]
+_TOT_KEYWORDS = ["approach a", "approach b", "approach c", "alternative", "option 1", "option 2",
+                 "multiple approaches", "different solutions"]
+_TOT_TAGS = ["<approach_a>", "<approach_b>", "<approach_c>", "<option_1>", "<option_2>", "<alternative_"]
+_JUDGE_KEYWORDS = ["rubric", "evaluate", "score", "rate", "criteria", "weighted", "judge", "assessment",
+                   "compare", "0-10", "1-10"]
+
+
+def _calculate_message_signals(message: Mapping[str, object]) -> Dict[str, object]:
+    """
+    Scan a single message for the keyword signals used by the traditional metrics.
+
+    The result only depends on the message itself, so it can be memoized by
+    message hash and reused when a student revises other messages.
+    """
+    text = str(message)
+    lowered = text.lower()
+    return {
+        "role": message.get("role"),
+        "xml_tags": [tag for tag in _XML_TAGS if f"<{tag}>" in lowered],
+        "cot_keywords": [kw for kw in _COT_KEYWORDS if kw in lowered],
+        "role_indicators": [ind for ind in _ROLE_INDICATORS if ind in lowered],
+        "tot_keywords": [kw for kw in _TOT_KEYWORDS if kw in lowered],
+        "tot_tags": [tag for tag in _TOT_TAGS if tag in lowered],
+        "judge_keywords": [kw for kw in _JUDGE_KEYWORDS if kw in lowered],
+        "has_percent": "%" in text,
+        "has_documents_tag": "<documents>" in lowered or "<document>" in lowered,
+        "has_source_tag": "<source>" in lowered,
+    }
+
+
+def _merge_found(signals: Sequence[Mapping[str, object]], key: str, table: Sequence[str]) -> List[str]:
+    """Union a per-message keyword list across messages, keeping the table order."""
+    found = set()
+    for signal in signals:
+        values = signal.get(key)
+        if isinstance(values, list):
+            found.update(values)
+    return [item for item in table if item in found]
+
+
 def _calculate_traditional_metrics(
     messages: Sequence[MutableMapping[str, object]],
     expected_tactics: Sequence[str],
+    message_signals: Optional[Sequence[Mapping[str, object]]] = None,
 ) -> Mapping[str, object]:
     """
     Calculate objective, quantitative metrics for prompt evaluation.
 
+    Args:
+        messages: The student's prompt (list of message dictionaries)
+        expected_tactics: Tactics the activity expects
+        message_signals: Optional precomputed `_calculate_message_signals`
+                         results, one per message (e.g. from the evaluation store)
+
     Returns:
         Dictionary with metric scores and evidence
     """
-    prompt_text = str(messages)
+    if message_signals is None:
+        message_signals = [_calculate_message_signals(msg) for msg in messages]
     metrics = {}
 
     # 1. Structure Detection
-    has_system_message = any(msg.get("role") == "system" for msg in messages)
+    has_system_message = any(sig.get("role") == "system" for sig in message_signals)
     metrics["has_system_message"] = has_system_message
 
     # 2. XML Tag Detection (for structured inputs)
-    xml_tags = []
-    common_tags = ["code", "requirements", "context", "example", "document", "thinking", "output",
-                   "test_file", "source_code", "analysis", "quotes", "evaluation"]
-    for tag in common_tags:
-        if f"<{tag}>" in prompt_text.lower():
-            xml_tags.append(tag)
+    xml_tags = _merge_found(message_signals, "xml_tags", _XML_TAGS)
     metrics["xml_tags_found"] = xml_tags
     metrics["uses_xml_structure"] = len(xml_tags) > 0
 
     # 3. Few-Shot Pattern Detection
-    assistant_messages = [msg for msg in messages if msg.get("role") == "assistant"]
-    metrics["example_count"] = len(assistant_messages)
-    metrics["uses_few_shot"] = len(assistant_messages) >= 2
+    assistant_count = sum(1 for sig in message_signals if sig.get("role") == "assistant")
+    metrics["example_count"] = assistant_count
+    metrics["uses_few_shot"] = assistant_count >= 2
 
     # 4. Chain-of-Thought Keywords
-    cot_keywords = ["step-by-step", "think through", "reasoning", "analyze", "before", "first", "then"]
-    cot_found = [kw for kw in cot_keywords if kw in prompt_text.lower()]
+    cot_found = _merge_found(message_signals, "cot_keywords", _COT_KEYWORDS)
     metrics["cot_keywords_found"] = cot_found
     metrics["uses_cot"] = len(cot_found) > 0
 
     # 5. Role Prompting Detection
-    role_indicators = ["you are a", "you are an", "act as", "role:", "persona:"]
-    role_found = [ind for ind in role_indicators if ind in prompt_text.lower()]
+    role_found = _merge_found(message_signals, "role_indicators", _ROLE_INDICATORS)
     metrics["role_indicators"] = role_found
     metrics["uses_role_prompting"] = len(role_found) > 0
 
     # 6. Tree of Thoughts Detection (multiple approaches/alternatives)
-    tot_keywords = ["approach a", "approach b", "approach c", "alternative", "option 1", "option 2", "multiple approaches", "different solutions"]
-    tot_tags = ["<approach_a>", "<approach_b>", "<approach_c>", "<option_1>", "<option_2>", "<alternative_"]
-    tot_found = [kw for kw in tot_keywords if kw in prompt_text.lower()]
-    tot_tags_found = [tag for tag in tot_tags if tag in prompt_text.lower()]
+    tot_found = _merge_found(message_signals, "tot_keywords", _TOT_KEYWORDS)
+    tot_tags_found = _merge_found(message_signals, "tot_tags", _TOT_TAGS)
     metrics["tot_keywords_found"] = tot_found + tot_tags_found
     metrics["uses_tree_of_thoughts"] = len(tot_found) >= 2 or len(tot_tags_found) >= 2  # At least 2 approaches
 
     # 7. LLM-as-Judge Detection (evaluation rubrics, scoring, weighted criteria)
-    judge_keywords = ["rubric", "evaluate", "score", "rate", "criteria", "weighted", "judge", "assessment", "compare", "0-10", "1-10"]
-    judge_found = [kw for kw in judge_keywords if kw in prompt_text.lower()]
-    has_percentages = "%" in prompt_text  # Weighted criteria like "40%", "30%"
+    judge_found = _merge_found(message_signals, "judge_keywords", _JUDGE_KEYWORDS)
+    has_percentages = any(sig.get("has_percent") for sig in message_signals)  # Weighted criteria like "40%", "30%"
     metrics["judge_keywords_found"] = judge_found
     metrics["uses_llm_as_judge"] = len(judge_found) >= 3 or (len(judge_found) >= 2 and has_percentages)
 
     # 8. Document Structure Detection (for citations)
-    has_doc_structure = "<documents>" in prompt_text.lower() or "<document>" in prompt_text.lower()
-    has_source_tags = "<source>" in prompt_text.lower()
+    has_doc_structure = any(sig.get("has_documents_tag") for sig in message_signals)
+    has_source_tags = any(sig.get("has_source_tag") for sig in message_signals)
     metrics["uses_document_structure"] = has_doc_structure and has_source_tags
 
     # 9. Prompt Length Analysis
-    total_chars = len(prompt_text)
+    total_chars = len(str(messages))
     metrics["total_characters"] = total_chars
     metrics["complexity"] = "high" if total_chars > 1000 else "medium" if total_chars > 300 else "low"
 
     return metrics
 
 
-def evaluate_prompt(
-    messages: Sequence[MutableMapping[str, object]],
-    activity_name: str,
-    expected_tactics: Sequence[str],
-) -> str:
-    """
-    Evaluate a student's prompt using Traditional Metrics + LLM-as-Judge.
-
-    This function provides comprehensive automated feedback by combining:
-    1. Traditional eval metrics (objective, fast, deterministic)
-    2. LLM-as-Judge (subjective, nuanced, educational)
-
-    Args:
-        messages: The student's prompt (list of message dictionaries)
-        activity_name: Name of the activity (e.g., "Activity 2.1")
-        expected_tactics: List of tactics that should be present
-                         (e.g., ["Role Prompting", "Structured Inputs"])
-
-    Returns:
-        String containing the full evaluation with metrics, feedback, and skill recommendations
-
-    Example:
-        >>> messages = [
-        ...     {"role": "system", "content": "You are a QA engineer..."},
-        ...     {"role": "user", "content": "<test_file>...</test_file>"}
-        ... ]
-        >>> evaluate_prompt(
-        ...     messages=messages,
-        ...     activity_name="Activity 2.1",
-        ...     expected_tactics=["Role Prompting", "Structured Inputs"]
-        ... )
-    """
-
-    # STEP 1: Calculate Traditional Metrics (Fast & Objective)
-    metrics = _calculate_traditional_metrics(messages, expected_tactics)
-
-    # Convert messages to string for LLM analysis
-    prompt_text = str(messages)
-
-    # STEP 2: Format Traditional Metrics for Display
-    xml_tags = metrics.get('xml_tags_found', [])
-    cot_keywords = metrics.get('cot_keywords_found', [])
-    role_indicators = metrics.get('role_indicators', [])
-    complexity = str(metrics.get('complexity', 'unknown'))
-
-    tot_keywords = metrics.get('tot_keywords_found', [])
-    judge_keywords = metrics.get('judge_keywords_found', [])
+# Tactic descriptions the judge is asked to check, by tactic name
+_TACTIC_DESCRIPTIONS: Dict[str, str] = {
+    "Role Prompting": "Check for specific, relevant persona with clear expertise domain",
+    "Structured Inputs": "Check for meaningful organization and clear section boundaries",
+    "Few-Shot Examples": "Check for high-quality examples that teach the desired pattern",
+    "Chain-of-Thought": "Check for systematic reasoning instructions",
+    "Reference Citations": "Check for proper document structure and quote extraction",
+    "Prompt Chaining": "Check for multi-step workflow with clear dependencies",
+    "LLM-as-Judge": "Check for clear evaluation rubrics and weighted criteria",
+    "Tree of Thoughts": "Check for exploring multiple solution approaches/alternatives in parallel"
+}
 
-    metrics_summary = f"""
-📏 TRADITIONAL EVAL METRICS (Objective Analysis)
-{'=' * 70}
-
-**Structure Analysis:**
-- Has system message: {'✅ Yes' if metrics.get('has_system_message') else '❌ No'}
-- XML tags detected: {', '.join(xml_tags) if xml_tags else 'None'}
-- Uses structured inputs: {'✅ Yes' if metrics.get('uses_xml_structure') else '❌ No'}
-
-**Tactic Detection:**
-- Few-shot examples: {metrics.get('example_count', 0)} examples {'✅' if metrics.get('uses_few_shot') else '❌'}
-- Chain-of-thought keywords: {', '.join(cot_keywords) if cot_keywords else 'None'} {'✅' if metrics.get('uses_cot') else '❌'}
-- Role indicators: {', '.join(role_indicators) if role_indicators else 'None'} {'✅' if metrics.get('uses_role_prompting') else '❌'}
-- Tree of Thoughts indicators: {', '.join(tot_keywords) if tot_keywords else 'None'} {'✅' if metrics.get('uses_tree_of_thoughts') else '❌'}
-- LLM-as-Judge indicators: {', '.join(judge_keywords) if judge_keywords else 'None'} {'✅' if metrics.get('uses_llm_as_judge') else '❌'}
-- Document structure: {'✅ Yes' if metrics.get('uses_document_structure') else '❌ No'}
-
-**Complexity:**
-- Total characters: {metrics.get('total_characters', 0)}
-- Complexity level: {complexity.upper()}
-
-{'=' * 70}
-"""
-
-    # Build tactic descriptions dynamically based on expected_tactics
-    tactic_descriptions = {
-        "Role Prompting": "Check for specific, relevant persona with clear expertise domain",
-        "Structured Inputs": "Check for meaningful organization and clear section boundaries",
-        "Few-Shot Examples": "Check for high-quality examples that teach the desired pattern",
-        "Chain-of-Thought": "Check for systematic reasoning instructions",
-        "Reference Citations": "Check for proper document structure and quote extraction",
-        "Prompt Chaining": "Check for multi-step workflow with clear dependencies",
-        "LLM-as-Judge": "Check for clear evaluation rubrics and weighted criteria",
-        "Tree of Thoughts": "Check for exploring multiple solution approaches/alternatives in parallel"
-    }
-
-    # Only include expected tactics in the evaluation criteria
-    criteria_list = []
-    for i, tactic in enumerate(expected_tactics, 1):
-        if tactic in tactic_descriptions:
-            criteria_list.append(f"{i}. **{tactic}**: {tactic_descriptions[tactic]}")
-
-    criteria_text = "\n".join(criteria_list)
-
-    # STEP 3: LLM-as-Judge Evaluation (Subjective & Nuanced)
-    evaluation_prompt = f"""You are an expert prompt engineering instructor evaluating a student's work.
+# LLM-as-Judge prompt; filled in with str.format() by `evaluate_prompt`
+_JUDGE_PROMPT_TEMPLATE = """You are an expert prompt engineering instructor evaluating a student's work.
 
 <traditional_metrics>
 {metrics_summary}
@@ -506,7 +675,7 @@ def evaluate_prompt(
 </student_prompt>
 
 <expected_tactics>
-{', '.join(expected_tactics)}
+{expected_tactics}
 </expected_tactics>
 
 <evaluation_criteria>
@@ -569,9 +738,153 @@ Highlight the strongest aspect and the most important area for improvement.
 </overall_feedback>
 """
 
-    # Get LLM-as-Judge evaluation
-    evaluation_messages: List[MutableMapping[str, object]] = [{"role": "user", "content": evaluation_prompt}]
-    llm_judgment = get_chat_completion(evaluation_messages)
+
+def _format_metrics_summary(metrics: Mapping[str, object]) -> str:
+    """Render the traditional metrics block shown to students and passed to the judge."""
+    xml_tags = metrics.get('xml_tags_found', [])
+    cot_keywords = metrics.get('cot_keywords_found', [])
+    role_indicators = metrics.get('role_indicators', [])
+    complexity = str(metrics.get('complexity', 'unknown'))
+
+    tot_keywords = metrics.get('tot_keywords_found', [])
+    judge_keywords = metrics.get('judge_keywords_found', [])
+
+    return f"""
+📏 TRADITIONAL EVAL METRICS (Objective Analysis)
+{'=' * 70}
+
+**Structure Analysis:**
+- Has system message: {'✅ Yes' if metrics.get('has_system_message') else '❌ No'}
+- XML tags detected: {', '.join(xml_tags) if xml_tags else 'None'}
+- Uses structured inputs: {'✅ Yes' if metrics.get('uses_xml_structure') else '❌ No'}
+
+**Tactic Detection:**
+- Few-shot examples: {metrics.get('example_count', 0)} examples {'✅' if metrics.get('uses_few_shot') else '❌'}
+- Chain-of-thought keywords: {', '.join(cot_keywords) if cot_keywords else 'None'} {'✅' if metrics.get('uses_cot') else '❌'}
+- Role indicators: {', '.join(role_indicators) if role_indicators else 'None'} {'✅' if metrics.get('uses_role_prompting') else '❌'}
+- Tree of Thoughts indicators: {', '.join(tot_keywords) if tot_keywords else 'None'} {'✅' if metrics.get('uses_tree_of_thoughts') else '❌'}
+- LLM-as-Judge indicators: {', '.join(judge_keywords) if judge_keywords else 'None'} {'✅' if metrics.get('uses_llm_as_judge') else '❌'}
+- Document structure: {'✅ Yes' if metrics.get('uses_document_structure') else '❌ No'}
+
+**Complexity:**
+- Total characters: {metrics.get('total_characters', 0)}
+- Complexity level: {complexity.upper()}
+
+{'=' * 70}
+"""
+
+
+def evaluate_prompt(
+    messages: Sequence[MutableMapping[str, object]],
+    activity_name: str,
+    expected_tactics: Sequence[str],
+    use_store: bool = True,
+    show_diff: bool = False,
+    refresh: bool = False,
+) -> str:
+    """
+    Evaluate a student's prompt using Traditional Metrics + LLM-as-Judge.
+
+    This function provides comprehensive automated feedback by combining:
+    1. Traditional eval metrics (objective, fast, deterministic)
+    2. LLM-as-Judge (subjective, nuanced, educational)
+
+    Results are memoized in a persistent evaluation store (see
+    `EVALUATION_STORE_PATH`): metrics for unchanged messages are reused, and a
+    byte-identical resubmission returns the stored judgment without a new LLM call.
+
+    Args:
+        messages: The student's prompt (list of message dictionaries)
+        activity_name: Name of the activity (e.g., "Activity 2.1")
+        expected_tactics: List of tactics that should be present
+                         (e.g., ["Role Prompting", "Structured Inputs"])
+        use_store: Reuse and update the evaluation store (set False for a one-off run
+                   that neither reads nor saves results)
+        show_diff: Print what changed since the previous attempt for this activity
+        refresh: Ask the LLM judge again even if this submission was judged before,
+                 replacing the stored judgment
+
+    Returns:
+        String containing the full evaluation with metrics, feedback, and skill recommendations
+
+    Example:
+        >>> messages = [
+        ...     {"role": "system", "content": "You are a QA engineer..."},
+        ...     {"role": "user", "content": "<test_file>...</test_file>"}
+        ... ]
+        >>> evaluate_prompt(
+        ...     messages=messages,
+        ...     activity_name="Activity 2.1",
+        ...     expected_tactics=["Role Prompting", "Structured Inputs"]
+        ... )
+    """
+
+    store = _get_evaluation_store() if use_store else None
+    message_hashes = [_hash_value(msg) for msg in messages]
+
+    # STEP 0: Diff-aware mode (compare against the previous attempt, even for one-off runs)
+    if show_diff:
+        previous = _get_evaluation_store().last_attempt(activity_name)
+        if previous:
+            print(_format_attempt_diff(previous, messages))
+        else:
+            print("🔍 No previous attempt stored for this activity - nothing to compare yet.")
+
+    # STEP 1: Calculate Traditional Metrics (Fast & Objective), reusing unchanged messages
+    message_signals: List[Dict[str, object]] = []
+    for msg, msg_hash in zip(messages, message_hashes):
+        signals = store.signals.get(msg_hash) if store else None
+        if signals is None:
+            signals = _calculate_message_signals(msg)
+            if store:
+                store.signals[msg_hash] = signals
+        message_signals.append(signals)
+    metrics = _calculate_traditional_metrics(messages, expected_tactics, message_signals)
+
+    # Convert messages to string for LLM analysis
+    prompt_text = str(messages)
+
+    # STEP 2: Format Traditional Metrics for Display
+    metrics_summary = _format_metrics_summary(metrics)
+
+    # Only include expected tactics in the evaluation criteria
+    criteria_list = []
+    for i, tactic in enumerate(expected_tactics, 1):
+        if tactic in _TACTIC_DESCRIPTIONS:
+            criteria_list.append(f"{i}. **{tactic}**: {_TACTIC_DESCRIPTIONS[tactic]}")
+
+    criteria_text = "\n".join(criteria_list)
+
+    # STEP 3: LLM-as-Judge Evaluation (Subjective & Nuanced)
+    evaluation_prompt = _JUDGE_PROMPT_TEMPLATE.format(
+        metrics_summary=metrics_summary,
+        prompt_text=prompt_text,
+        expected_tactics=', '.join(expected_tactics),
+        criteria_text=criteria_text,
+    )
+
+    # Get LLM-as-Judge evaluation (stored judgment if this exact submission was judged before)
+    judgment_key = _hash_value({
+        "messages": message_hashes,
+        "expected_tactics": _hash_value(list(expected_tactics)),
+        "provider": PROVIDER,
+        "model": get_default_model(),
+    })
+    stored_judgment = store.judgments.get(judgment_key) if store and not refresh else None
+    reused_judgment = bool(stored_judgment)
+    if stored_judgment:
+        llm_judgment = stored_judgment
+    else:
+        evaluation_messages: List[MutableMapping[str, object]] = [{"role": "user", "content": evaluation_prompt}]
+        llm_judgment = get_chat_completion(evaluation_messages)
+
+    if store:
+        # Never store an empty judgment, or every resubmission would replay the blank result
+        has_judgment = bool(str(llm_judgment).strip())
+        if has_judgment:
+            store.judgments[judgment_key] = llm_judgment
+        store.record_attempt(activity_name, messages, message_hashes, judgment_key if has_judgment else None)
+        store.save()
 
     # STEP 4: Print Combined Results
     print("=" * 70)
@@ -580,6 +893,8 @@ Highlight the strongest aspect and the most important area for improvement.
     print(metrics_summary)
     print("\n👨‍⚖️ LLM-AS-JUDGE EVALUATION (Qualitative Analysis)")
     print("=" * 70)
+    if reused_judgment:
+        print("♻️ Identical submission - showing the stored judgment (no new LLM call).")
     print(llm_judgment)
     print("\n" + "=" * 70)
     print("💡 Next Steps:")
@@ -601,7 +916,9 @@ __all__ = [
     "AVAILABLE_PROVIDERS",
     "CLAUDE_DEFAULT_MODEL",
     "CIRCUIT_DEFAULT_MODEL",
+    "EVALUATION_STORE_PATH",
     "OPENAI_DEFAULT_MODEL",
+    "clear_evaluation_store",
     "configure_circuit_from_env",
     "configure_openai_from_env",
     "evaluate_prompt",